@@ -2,13 +2,95 @@
 """
 Script to add UUID7 GUIDs to all tests in YAML files.
 This should be run by the CI/CD pipeline before merging to main.
+Pass --verify to also check all YAML files for duplicate GUIDs.
 """
 
-import glob
+import json
+import os
 import re
 import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
 from uuid import uuid7
 
+try:
+    # google-re2 is a linear-time engine, used when installed for the bulk scans
+    import re2 as _re_fast
+except ImportError:
+    _re_fast = re
+
+# Per-file mtime, size and GUIDs from the previous run, used to skip unchanged files
+_GUID_CACHE_FILE = ".guid_cache.json"
+
+# Smallest number of changed files worth scanning in worker processes; below
+# this a process pool's start-up costs more than the scan itself
+_POOL_MIN_FILES = 2000
+
+# Patterns work on raw bytes: the GUID content is pure ASCII, so files are
+# never decoded and the rewrite is written back exactly as read. Lines may end
+# in CRLF, so every pattern allows a "\r" before the end of the line.
+_UUID_PATTERN = rb"[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}"
+# UUID7 uses version 7, so we look for UUIDs with version 7 in the correct position
+_UUID7_PATTERN = (
+    rb"[a-f0-9]{8}-[a-f0-9]{4}-7[a-f0-9]{3}-[89aAbB][a-f0-9]{3}-[a-f0-9]{12}"
+)
+
+# Any "guid:" line that already holds a well-formed UUID
+_GUID_LINE_RE = _re_fast.compile(
+    rb"(?im)^[ \t]*guid:[ \t]*(" + _UUID_PATTERN + rb")[ \t]*\r?$"
+)
+
+# Every line the rewrite cares about, in a single pattern:
+#   name: a "- name:" line that is not already followed by a "guid:" line
+#   guid: any "guid:" line, with whatever follows it captured as "value"
+# A trailing "\r" is kept out of both, in "eol" for name lines.
+_GUID_TOKEN_RE = re.compile(
+    rb"(?P<name>^(?P<lead>[ \t]*)-(?P<gap>[ \t]*)name:[^\r\n]*)(?P<eol>\r?)$(?!\s*guid)"
+    rb"|^(?P<guid>[ \t]*guid:)(?P<value>[^\r\n]*)(?=\r?$)",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Replacement for a "name" token: the line itself, then a "guid:" line lined
+# up with "name:" (the list dash becomes a space), using the file's line ending
+_GUID_INSERT_TEMPLATE = rb"\g<name>\g<eol>\n\g<lead> \g<gap>guid: "
+# Checks on a captured "guid:" value, only run for the few "guid:" lines found
+_UUID_VALUE_RE = re.compile(rb"[ \t]*(" + _UUID_PATTERN + rb")[ \t]*", re.IGNORECASE)
+_UUID7_VALUE_RE = re.compile(rb"[ \t]*" + _UUID7_PATTERN, re.IGNORECASE)
+
+# The starts of "- name:" and "guid:" lines, matched exactly like in the
+# patterns above, so the quick checks agree with the rewrite
+_NAME_KEY_RE = _re_fast.compile(rb"(?im)^[ \t]*-[ \t]*name:")
+_GUID_KEY_RE = _re_fast.compile(rb"(?im)^[ \t]*guid:")
+# A "- name:" line directly followed by a "guid:" line, i.e. one that is not a
+# "name" token above
+_NAME_GUID_RE = _re_fast.compile(rb"(?im)^[ \t]*-[ \t]*name:[^\r\n]*\r?$\s*guid")
+
+# A "guid:" line that already holds a UUID7
+_GUID7_LINE_RE = _re_fast.compile(
+    rb"(?im)^[ \t]*guid:[ \t]*(" + _UUID7_PATTERN + rb")[ \t]*\r?$"
+)
+
+
+def _new_guid() -> str:
+    """Return a new UUID7 in its canonical lowercase, dashed form"""
+    return str(uuid7())
+
+
+def _iter_yaml(root: str):
+    """Recursively yield the paths of all .yaml files under root"""
+    try:
+        entries = list(os.scandir(root))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        # Skip hidden entries, like glob does
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_yaml(entry.path)
+        elif entry.name.endswith(".yaml"):
+            yield entry.path
+
 
 def generate_guids_for_yaml(path: str, get_guid: callable, existing_guids: set) -> bool:
     """
@@ -16,56 +98,87 @@ def generate_guids_for_yaml(path: str, get_guid: callable, existing_guids: set)
 
     Args:
         path: Path to the YAML file
-        get_guid: Function that returns a new GUID string
-        existing_guids: Set of GUIDs that already exist across all files
+        get_guid: Function that returns a new lowercase GUID string
+        existing_guids: Set of lowercase GUIDs that already exist across all files
 
     Returns:
         True if file was modified, False otherwise
     """
-    with open(path, "r") as file:
+    with open(path, "rb") as file:
         og_text = file.read()
 
-    # First, extract all existing GUIDs from this file to add to our tracking set
-    existing_guid_matches = re.findall(
-        r"(?i)^[ \t]*guid:[ \t]*([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})[ \t]*$",
-        og_text,
-        flags=re.MULTILINE,
-    )
-    for guid in existing_guid_matches:
-        existing_guids.add(guid.lower())
-
-    # Add the "guid:" element after the "- name:" element if it isn't already there
-    text = re.sub(
-        r"(?i)(^([ \t]*-[ \t]*)name:.*$(?!\s*guid))",
-        lambda m: f"{m.group(1)}\n{m.group(2).replace('-', ' ')}guid:",
-        og_text,
-        flags=re.MULTILINE,
-    )
-
-    # Fill the "guid:" element in if it doesn't contain a guid (UUID7 format)
-    # UUID7 uses version 7, so we look for UUIDs with version 7 in the correct position
-    def replace_guid(m):
-        new_guid = get_guid()
-        # Ensure uniqueness - keep generating until we get a unique one
-        while new_guid.lower() in existing_guids:
-            print(f"  ⚠️  Duplicate GUID detected: {new_guid}, generating new one...")
-            new_guid = get_guid()
-        existing_guids.add(new_guid.lower())
-        return f"{m.group(1)} {new_guid}"
-
-    text = re.sub(
-        r"(?i)^([ \t]*guid:)(?!([ \t]*[a-f0-9]{8}-[a-f0-9]{4}-7[a-f0-9]{3}-[89aAbB][a-f0-9]{3}-[a-f0-9]{12})).*$",
-        replace_guid,
-        text,
-        flags=re.MULTILINE,
-    )
-
-    if text != og_text:
-        with open(path, "wb") as file:
-            # using wb mode instead of w. If not, the end of line characters are auto-converted to OS specific ones.
-            file.write(text.encode())
-        return True
-    return False
+    # Nothing to add or fill in
+    name_lines = _NAME_KEY_RE.findall(og_text)
+    guid_lines = _GUID_KEY_RE.findall(og_text)
+    if not name_lines and not guid_lines:
+        return False
+
+    # Fast path: every "- name:" line is directly followed by a "guid:" line and
+    # every "guid:" line holds a UUID7, so the rewrite below has no slots
+    guid7_matches = _GUID7_LINE_RE.findall(og_text)
+    if len(guid7_matches) == len(guid_lines) and len(
+        _NAME_GUID_RE.findall(og_text)
+    ) == len(name_lines):
+        existing_guids.update(map(bytes.decode, map(bytes.lower, guid7_matches)))
+        return False
+
+    matches = list(_GUID_TOKEN_RE.finditer(og_text))
+    slots = []
+    for m in matches:
+        if m.group("name"):
+            # A "- name:" line without a "guid:"
+            slots.append(m)
+            continue
+
+        # First, extract all existing GUIDs from this file to add to our tracking set
+        value = m.group("value")
+        existing = _UUID_VALUE_RE.fullmatch(value)
+        if existing:
+            existing_guids.add(existing.group(1).decode().lower())
+        # A "guid:" line without a UUID7
+        if not _UUID7_VALUE_RE.match(value):
+            slots.append(m)
+
+    if not slots:
+        return False
+
+    # Generate all the GUIDs this file needs at once and ensure uniqueness
+    # for the whole batch - keep generating until we get a unique one
+    while True:
+        new_guids = [get_guid() for _ in slots]
+        unique_guids = set(new_guids)
+        if len(unique_guids) == len(new_guids) and unique_guids.isdisjoint(
+            existing_guids
+        ):
+            break
+        print("  ⚠️  Duplicate GUID detected, generating new ones...")
+    existing_guids.update(unique_guids)
+
+    chunks = []
+    last = 0
+    for m, guid in zip(slots, new_guids):
+        if m.group("name"):
+            # Add the "guid:" element after the "- name:" element if it isn't already there
+            replacement = (
+                m.expand(_GUID_INSERT_TEMPLATE) + guid.encode() + m.group("eol")
+            )
+        else:
+            # Fill the "guid:" element in if it doesn't contain a guid (UUID7 format)
+            replacement = m.group("guid") + b" " + guid.encode()
+        chunks.append(og_text[last : m.start()])
+        chunks.append(replacement)
+        last = m.end()
+
+    chunks.append(og_text[last:])
+    with open(path, "wb") as file:
+        # using wb mode instead of w. If not, the end of line characters are auto-converted to OS specific ones.
+        file.write(b"".join(chunks))
+    return True
+
+
+def _line_number(path: str, offset: int) -> int:
+    """Return the 1-based line number of a byte offset in a file"""
+    return Path(path).read_bytes().count(b"\n", 0, offset) + 1
 
 
 def check_for_duplicate_guids(yaml_dir: str = "yaml") -> tuple[bool, dict]:
@@ -78,51 +191,145 @@ def check_for_duplicate_guids(yaml_dir: str = "yaml") -> tuple[bool, dict]:
     Returns:
         Tuple of (has_duplicates, guid_locations_map)
     """
-    yaml_files = glob.glob(f"{yaml_dir}/**/*.yaml", recursive=True)
-    guid_locations = {}  # guid -> list of (file, line_number)
+    yaml_files = list(_iter_yaml(yaml_dir))
+    guid_locations = {}  # guid -> list of (file, offset)
 
+    # Scan one file at a time, so memory stays bounded by the largest file
     for yaml_file in yaml_files:
-        with open(yaml_file, "r") as f:
-            for line_num, line in enumerate(f, 1):
-                match = re.match(
-                    r"(?i)^[ \t]*guid:[ \t]*([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})[ \t]*$",
-                    line,
-                )
-                if match:
-                    guid = match.group(1).lower()
-                    if guid not in guid_locations:
-                        guid_locations[guid] = []
-                    guid_locations[guid].append((yaml_file, line_num))
+        data = Path(yaml_file).read_bytes()
+        for match in _GUID_LINE_RE.finditer(data):
+            guid = match.group(1).decode().lower()
+            if guid not in guid_locations:
+                guid_locations[guid] = []
+            guid_locations[guid].append((yaml_file, match.start()))
 
     # Find duplicates
     duplicates = {guid: locs for guid, locs in guid_locations.items() if len(locs) > 1}
 
+    # Line numbers are only needed for reporting, so resolve them for duplicates only
+    for guid, locs in duplicates.items():
+        duplicates[guid] = [
+            (yaml_file, _line_number(yaml_file, offset)) for yaml_file, offset in locs
+        ]
+
     return len(duplicates) > 0, duplicates
 
 
+def _collect_guids(path: str) -> set:
+    """Return the lowercased GUIDs already present in a YAML file"""
+    with open(path, "rb") as file:
+        guids = _GUID_LINE_RE.findall(file.read())
+    return set(map(bytes.decode, map(bytes.lower, guids)))
+
+
+def _rewrite_file(path: str, existing_guids: frozenset) -> tuple[bool, set]:
+    """Process pool worker for generate_guids_for_yaml
+
+    Returns:
+        Tuple of (was_updated, guids_now_in_file)
+    """
+    # New GUIDs only need to avoid the ones already in the tree; UUID7s
+    # generated concurrently in other workers will not collide in practice.
+    updated = generate_guids_for_yaml(path, _new_guid, set(existing_guids))
+    return updated, _collect_guids(path)
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs each call right away in the calling process"""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def _process_pool(item_count: int, min_items: int) -> Executor:
+    """Return a process pool for item_count items, or an inline executor when one wouldn't pay off.
+
+    Every worker process re-imports this script, which costs far more than
+    scanning a small tree, so inputs under min_items run inline.
+    """
+    workers = min(os.cpu_count() or 1, item_count)
+    if workers <= 1 or item_count < min_items:
+        return _InlineExecutor()
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _load_guid_cache() -> dict:
+    """Load the path -> [mtime_ns, size, guids] cache from a previous run"""
+    if not os.path.exists(_GUID_CACHE_FILE):
+        return {}
+    try:
+        with open(_GUID_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"  ⚠️  Ignoring unreadable {_GUID_CACHE_FILE}: {e}")
+        return {}
+
+
+def _save_guid_cache(cache: dict) -> None:
+    """Save the path -> [mtime_ns, size, guids] cache for the next run"""
+    try:
+        with open(_GUID_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"  ⚠️  Failed to write {_GUID_CACHE_FILE}: {e}")
+
+
 def add_guids_to_yaml_files(yaml_dir: str = "yaml") -> tuple[int, int]:
     """
     Add GUIDs to all tests in YAML files that don't already have them.
 
+    Files whose mtime and size match the cache from a previous run are
+    skipped, and the GUIDs recorded for them are used for uniqueness.
+
     Args:
         yaml_dir: Directory containing YAML files
 
     Returns:
         Tuple of (total_files, files_updated)
     """
-    yaml_files = glob.glob(f"{yaml_dir}/**/*.yaml", recursive=True)
+    yaml_files = list(_iter_yaml(yaml_dir))
     total_files = len(yaml_files)
     files_updated = 0
 
-    # Track all GUIDs across all files to ensure uniqueness
-    existing_guids = set()
-
+    cache = _load_guid_cache()
+    new_cache = {}
+    changed_files = []
     for yaml_file in yaml_files:
-        print(f"Processing {yaml_file}...")
+        st = os.stat(yaml_file)
+        entry = cache.get(yaml_file)
+        if entry and entry[:2] == [st.st_mtime_ns, st.st_size]:
+            new_cache[yaml_file] = entry
+        else:
+            changed_files.append(yaml_file)
+
+    chunksize = max(1, len(changed_files) // (4 * (os.cpu_count() or 1)))
+
+    with _process_pool(len(changed_files), _POOL_MIN_FILES) as executor:
+        # Track all GUIDs across all files to ensure uniqueness
+        existing_guids = frozenset().union(
+            *(entry[2] for entry in new_cache.values()),
+            *executor.map(_collect_guids, changed_files, chunksize=chunksize),
+        )
+
+        results = executor.map(
+            _rewrite_file, changed_files, repeat(existing_guids), chunksize=chunksize
+        )
+        for yaml_file, (was_updated, guids) in zip(changed_files, results):
+            print(f"Processing {yaml_file}...")
 
-        if generate_guids_for_yaml(yaml_file, lambda: str(uuid7()), existing_guids):
-            files_updated += 1
-            print(f"  ✓ Updated {yaml_file}")
+            if was_updated:
+                files_updated += 1
+                print(f"  ✓ Updated {yaml_file}")
+
+            st = os.stat(yaml_file)
+            new_cache[yaml_file] = [st.st_mtime_ns, st.st_size, sorted(guids)]
+
+    _save_guid_cache(new_cache)
 
     return total_files, files_updated
 
@@ -140,19 +347,21 @@ def main():
     print(f"Files updated with GUIDs: {files_updated}")
     print("=" * 60)
 
-    # Check for duplicates after processing
-    print("\nChecking for duplicate GUIDs...")
-    has_duplicates, duplicates = check_for_duplicate_guids()
-
-    if has_duplicates:
-        print("\n❌ ERROR: Duplicate GUIDs found!")
-        for guid, locations in duplicates.items():
-            print(f"\n  GUID {guid} appears in:")
-            for file_path, line_num in locations:
-                print(f"    - {file_path}:{line_num}")
-        sys.exit(2)  # Exit with error code 2 for duplicates
-    else:
-        print("✓ No duplicate GUIDs found.")
+    # Check for duplicates after processing. New GUIDs are already kept unique
+    # while they are generated, so the full re-scan only runs on request.
+    if "--verify" in sys.argv:
+        print("\nChecking for duplicate GUIDs...")
+        has_duplicates, duplicates = check_for_duplicate_guids()
+
+        if has_duplicates:
+            print("\n❌ ERROR: Duplicate GUIDs found!")
+            for guid, locations in duplicates.items():
+                print(f"\n  GUID {guid} appears in:")
+                for file_path, line_num in locations:
+                    print(f"    - {file_path}:{line_num}")
+            sys.exit(2)  # Exit with error code 2 for duplicates
+        else:
+            print("✓ No duplicate GUIDs found.")
 
     if files_updated > 0:
         print("\n⚠️  YAML files have been modified with new GUIDs.")
@@ -1,24 +1,41 @@
-import glob
+import functools
+import importlib.util
 import json
 import os
 import re
 import shutil
 import subprocess
-import tempfile
+import time
+from collections import Counter
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from pathlib import Path
 from typing import Annotated, Literal, Optional
 from uuid import UUID
 
-import requests
 import typer
 from jinja2 import Environment, FileSystemLoader
-from mitreattack.stix20 import MitreAttackData
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from rich.console import Console
-from rich.table import Table
 
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Use the libyaml C parser when PyYAML was built with it
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 app = typer.Typer(
     name="LOAS",
     help="LOAS (Living Off AppleScript) - Convert YAML test definitions to OSAScript applications",
@@ -26,14 +43,30 @@ app = typer.Typer(
 )
 console = Console()
 
-# Setup Jinja2 environment
+# Setup Jinja2 environment. Templates don't change during a run, so skip the
+# mtime check jinja2 otherwise does on every get_template call.
 template_dir = os.path.join(os.path.dirname(__file__), "templates")
-jinja_env = Environment(loader=FileSystemLoader(template_dir))
+jinja_env = Environment(loader=FileSystemLoader(template_dir), auto_reload=False)
+
+# The downloaded MITRE ATT&CK data is kept on disk between runs
+MITRE_ATTACK_URL = "https://raw.githubusercontent.com/mitre/cti/master/enterprise-attack/enterprise-attack.json"
+MITRE_ATTACK_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "loas"
+)
+MITRE_ATTACK_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+# Generated technique docs, e.g. T1000.mdx or T1000.001.mdx
+_TECHNIQUE_DOC_RE = re.compile(r"T\d{4}(?:\.\d{3})?\.mdx\Z")
 
-# Global variable to cache MITRE ATT&CK data
-_mitre_attack_data = None
+# Smallest number of YAML files worth parsing in worker processes; below this
+# a process pool's start-up costs more than the parse itself
+PARSE_POOL_MIN_FILES = 2000
 
+# Same for rendering outputs from YAML files, which costs a few ms per file
+RENDER_POOL_MIN_FILES = 200
 
+
+@functools.cache
 def get_version() -> str:
     """Get version from environment variable or package.json"""
     # First try to get from environment variable (set during build)
@@ -43,11 +76,10 @@ def get_version() -> str:
 
     # Fallback to reading from package.json
     try:
-        package_json_path = os.path.join("docs", "package.json")
-        if os.path.exists(package_json_path):
-            with open(package_json_path, "r") as f:
-                package_data = json.load(f)
-                return package_data.get("version", "0.1.4")
+        package_data = json.loads(Path("docs", "package.json").read_bytes())
+        return package_data.get("version", "0.1.4")
+    except FileNotFoundError:
+        pass
     except Exception as e:
         console.print(
             f"[yellow]Warning: Failed to read version from package.json: {e}[/yellow]"
@@ -65,73 +97,186 @@ def check_directory_exists(directory: str, name: str) -> bool:
     return True
 
 
-def count_files(directory: str, pattern: str) -> int:
-    """Count files matching pattern in directory, return 0 if directory doesn't exist"""
-    if not os.path.exists(directory):
-        return 0
-    return len(glob.glob(f"{directory}/**/{pattern}", recursive=True))
+def iter_files(root: str, suffix: str | tuple[str, ...]):
+    """Recursively yield the paths of entries under root whose name ends with suffix"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            continue
+        subdirs = []
+        with entries:
+            for entry in entries:
+                # Skip hidden entries, like glob does
+                if entry.name.startswith("."):
+                    continue
+                if entry.name.endswith(suffix):
+                    # Matched directories such as .app bundles are not descended into
+                    yield entry.path
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+        # Visit subdirectories in scandir order, giving the same order as glob
+        stack.extend(reversed(subdirs))
+
+
+def count_files(directory: str, suffix: str) -> int:
+    """Count files ending with suffix in directory, return 0 if directory doesn't exist"""
+    return sum(1 for _ in iter_files(directory, suffix))
+
+
+def parallel_rmtree(path: str) -> None:
+    """Remove a directory tree, unlinking its files on several threads"""
+    # Like shutil.rmtree, refuse to follow a symlinked root into its target
+    if os.path.islink(path):
+        raise OSError("Cannot call rmtree on a symbolic link")
+
+    files = []
+    dirs = []
+    stack = [path]
+    while stack:
+        directory = stack.pop()
+        dirs.append(directory)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
 
+    # Unlinks are syscall bound, so overlap them; list() re-raises the first error
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(os.unlink, files))
 
-def get_mitre_attack_data():
-    """Get or initialize MITRE ATT&CK data"""
-    global _mitre_attack_data
-    if _mitre_attack_data is None:
-        try:
-            # Download the latest enterprise attack data from MITRE's GitHub
-            console.print("[blue]Downloading MITRE ATT&CK data...[/blue]")
+    # Every directory was found after its parent, so remove them in reverse
+    for directory in reversed(dirs):
+        os.rmdir(directory)
 
-            response = requests.get(
-                "https://raw.githubusercontent.com/mitre/cti/master/enterprise-attack/enterprise-attack.json"
-            )
-            response.raise_for_status()
 
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as f:
-                f.write(response.text)
-                temp_file = f.name
+def is_up_to_date(output_path: str, *sources: str) -> bool:
+    """Check whether output_path exists and is at least as new as all of its sources"""
+    try:
+        output_mtime = os.stat(output_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return all(os.stat(source).st_mtime_ns <= output_mtime for source in sources)
 
-            _mitre_attack_data = MitreAttackData(temp_file)
-            console.print("[green]✅ MITRE ATT&CK data loaded successfully[/green]")
 
-            # Clean up temp file
-            os.unlink(temp_file)
+def print_file_results(title: str, results: list[tuple[str, str]]) -> None:
+    """Print the per-file results of a step as a single table"""
+    from rich.table import Table
 
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: Failed to load MITRE ATT&CK data: {e}[/yellow]"
-            )
-            _mitre_attack_data = None
-    return _mitre_attack_data
+    table = Table(title=title)
+    table.add_column("Status", style="green", no_wrap=True)
+    table.add_column("Path", style="cyan")
+    for status, path in results:
+        table.add_row(status, path)
+    console.print(table)
 
 
-def get_technique_description(technique_id: str) -> str:
-    """Get technique description from MITRE ATT&CK data"""
+def _fetch_mitre_attack_json() -> Path:
+    """Return the path of a local copy of the MITRE ATT&CK data, refreshing it if stale"""
+    import requests
+
+    cache_file = MITRE_ATTACK_CACHE_DIR / "enterprise-attack.json"
+    etag_file = MITRE_ATTACK_CACHE_DIR / "enterprise-attack.json.etag"
+
+    if cache_file.exists():
+        age = time.time() - cache_file.stat().st_mtime
+        if age < MITRE_ATTACK_CACHE_TTL:
+            return cache_file
+
+    headers = {}
+    if cache_file.exists() and etag_file.exists():
+        headers["If-None-Match"] = etag_file.read_text().strip()
+
+    tmp_file = cache_file.with_suffix(".json.tmp")
     try:
-        mitre_data = get_mitre_attack_data()
-        if mitre_data is None:
-            return f"This technique demonstrates various methods for {technique_id} using AppleScript and JavaScript."
+        console.print("[blue]Downloading MITRE ATT&CK data...[/blue]")
+        with requests.get(
+            MITRE_ATTACK_URL, headers=headers, stream=True, timeout=60
+        ) as response:
+            response.raise_for_status()
+
+            if response.status_code == 304:
+                # Unchanged upstream, restart the TTL
+                cache_file.touch()
+                return cache_file
+
+            # Stream to disk in 64 KiB chunks instead of holding the whole file in memory
+            MITRE_ATTACK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+            etag = response.headers.get("ETag")
+    except Exception as e:
+        tmp_file.unlink(missing_ok=True)
+        if not cache_file.exists():
+            raise
+        console.print(
+            f"[yellow]Warning: Failed to refresh MITRE ATT&CK data, using cached copy: {e}[/yellow]"
+        )
+        return cache_file
+
+    tmp_file.replace(cache_file)
+    if etag:
+        etag_file.write_text(etag)
+    else:
+        etag_file.unlink(missing_ok=True)
+    return cache_file
+
+
+@functools.cache
+def get_mitre_attack_data():
+    """Get or initialize MITRE ATT&CK data, loaded at most once per run"""
+    try:
+        # mitreattack pulls in stix2 and friends, so only import it when needed
+        from mitreattack.stix20 import MitreAttackData
+
+        mitre_attack_data = MitreAttackData(str(_fetch_mitre_attack_json()))
+        console.print("[green]✅ MITRE ATT&CK data loaded successfully[/green]")
+        return mitre_attack_data
+
+    except Exception as e:
+        console.print(
+            f"[yellow]Warning: Failed to load MITRE ATT&CK data: {e}[/yellow]"
+        )
+        return None
+
 
-        # Get all techniques
-        techniques = mitre_data.get_techniques()
+@functools.lru_cache(maxsize=1)
+def _technique_index() -> dict[str, str]:
+    """Map each ATT&CK technique ID to its description, built once per run"""
+    mitre_data = get_mitre_attack_data()
+    if mitre_data is None:
+        return {}
 
-        # Find the technique by ID
-        for technique in techniques:
-            if hasattr(technique, "external_references"):
-                for ref in technique.external_references:
-                    if hasattr(ref, "external_id") and ref.external_id == technique_id:
-                        if hasattr(technique, "description"):
-                            return technique.description
+    index = {}
+    for technique in mitre_data.get_techniques():
+        if not hasattr(technique, "description"):
+            continue
+        for ref in getattr(technique, "external_references", ()):
+            external_id = getattr(ref, "external_id", None)
+            if external_id and external_id.startswith("T"):
+                # Keep the first match, as the previous linear scan did
+                index.setdefault(external_id, technique.description)
+    return index
 
+
+@functools.cache
+def get_technique_description(technique_id: str) -> str:
+    """Get technique description from MITRE ATT&CK data"""
+    default = f"This technique demonstrates various methods for {technique_id} using AppleScript and JavaScript."
+    try:
         # If not found, return a generic description
-        return f"This technique demonstrates various methods for {technique_id} using AppleScript and JavaScript."
+        return _technique_index().get(technique_id, default)
 
     except Exception as e:
         console.print(
             f"[yellow]Warning: Failed to get technique description for {technique_id}: {e}[/yellow]"
         )
-        return f"This technique demonstrates various methods for {technique_id} using AppleScript and JavaScript."
+        return default
 
 
 # temp fix for RAE commands
@@ -160,6 +305,21 @@ def _preprocess_eppc_command(command: str) -> str:
     return pattern.sub(_replace, command)
 
 
+# Used to turn script names into safe filenames
+_UNSAFE_CHARS_RE = re.compile(r"[^\w\s-]")
+_WS_RE = re.compile(r"[-\s]+")
+
+# Matches #{arg_name} placeholders, with or without surrounding quotes
+_QUOTED_ARG_RE = re.compile(r'"#\{(\w+)\}"|#\{(\w+)\}')
+_ARG_RE = re.compile(r"#\{(\w+)\}")
+
+# First line of every generated JavaScript for Automation script
+_JXA_SHEBANG = "#!/usr/bin/osascript -l JavaScript\n"
+
+# Swift type for each YAML scalar type an argument default can have
+_SWIFT_TYPES = {str: "String", bool: "Bool", int: "Int", float: "Double"}
+
+
 class Script(BaseModel):
     name: str
     command: str
@@ -175,31 +335,31 @@ class Script(BaseModel):
         """Convert the script to OSAScript/JavaScript format with help function and parameter handling"""
         template = jinja_env.get_template("osascript.j2")
 
-        command = _preprocess_eppc_command(self.command)
+        command = _preprocess_eppc_command(self.command).strip()
+
+        # Replace "#{arg_name}" (with or without quotes) with just the parameter
+        # name, in a single pass over the whole command
+        body = command
+        if self.args:
+            args = self.args
+
+            def _replace(m: re.Match) -> str:
+                arg_name = m.group(1) or m.group(2)
+                return arg_name if arg_name in args else m.group(0)
+
+            body = _QUOTED_ARG_RE.sub(_replace, command)
+        command_lines = body.split("\n")
         framework_lines = []
-        command_lines = []
 
         # Check if command uses frameworks and separate them
         if "use framework" in command:
-            for line in command.strip().split("\n"):
-                if line.strip().startswith("use framework"):
-                    framework_lines.append(line.strip())
+            lines = command_lines
+            command_lines = []
+            for original, line in zip(command.split("\n"), lines):
+                if original.strip().startswith("use framework"):
+                    framework_lines.append(original.strip())
                 else:
                     command_lines.append(line)
-        else:
-            command_lines = command.strip().split("\n")
-
-        # Replace template variables in command if args exist
-        if self.args:
-            processed_lines = []
-            for line in command_lines:
-                for arg_name in self.args.keys():
-                    # Replace "#{arg_name}" (with quotes) with just the parameter name
-                    line = line.replace(f'"#{{{arg_name}}}"', arg_name)
-                    # Replace #{arg_name} (without quotes) with the parameter name
-                    line = line.replace(f"#{{{arg_name}}}", arg_name)
-                processed_lines.append(line)
-            command_lines = processed_lines
 
         return template.render(
             name=self.name,
@@ -210,117 +370,61 @@ class Script(BaseModel):
 
     def to_javascript(self) -> str:
         """Convert the script to JavaScript format"""
-        return "\n".join(["#!/usr/bin/osascript -l JavaScript", self.command])
-
-    def to_swift_wrapper(self) -> str:
-        """Convert the AppleScript to a Swift wrapper that executes it via NSAppleScript"""
-        template = jinja_env.get_template("swift_wrapper.j2")
-
-        command = self.command
-        command_lines = []
+        return _JXA_SHEBANG + self.command
 
-        # Process the AppleScript command
-        if self.args:
-            # Replace template variables
-            for line in command.strip().split("\n"):
-                for arg_name in self.args.keys():
-                    # Replace #{arg_name} (without quotes) with Swift string interpolation
-                    line = line.replace(f"#{{{arg_name}}}", f"\\({arg_name})")
-                command_lines.append(line)
-        else:
-            command_lines = command.strip().split("\n")
-
-        # Build param_types and swift_types for template
+    def _swift_template_context(self) -> dict:
+        """Build the template variables shared by both Swift wrappers in one pass over args"""
+        command = self.command.strip()
         param_types = []
         swift_types = {}
         arg_names = []
 
         if self.args:
-            for arg_name, default_value in self.args.items():
-                arg_names.append(f"{arg_name}: {arg_name}")
+            args = self.args
 
-                if isinstance(default_value, str):
-                    swift_type = "String"
-                elif isinstance(default_value, bool):
-                    swift_type = "Bool"
-                elif isinstance(default_value, int):
-                    swift_type = "Int"
-                elif isinstance(default_value, float):
-                    swift_type = "Double"
-                else:
-                    swift_type = "String"
+            # Replace #{arg_name} (without quotes) with Swift string
+            # interpolation, in a single pass over the whole command
+            def _replace(m: re.Match) -> str:
+                arg_name = m.group(1)
+                return f"\\({arg_name})" if arg_name in args else m.group(0)
 
+            command = _ARG_RE.sub(_replace, command)
+
+            # Build param_types and swift_types for template
+            for arg_name, default_value in args.items():
+                arg_names.append(f"{arg_name}: {arg_name}")
+
+                swift_type = _SWIFT_TYPES.get(type(default_value), "String")
                 param_types.append(f"{arg_name}: {swift_type}")
                 swift_types[arg_name] = swift_type
 
-        return template.render(
-            name=self.name,
-            command_lines=command_lines,
-            args=self.args or {},
-            param_types=param_types,
-            swift_types=swift_types,
-            arg_names=arg_names,
-        )
+        return {
+            "name": self.name,
+            "command_lines": command.split("\n"),
+            "args": self.args or {},
+            "param_types": param_types,
+            "swift_types": swift_types,
+            "arg_names": arg_names,
+        }
+
+    def to_swift_wrapper(self) -> str:
+        """Convert the AppleScript to a Swift wrapper that executes it via NSAppleScript"""
+        template = jinja_env.get_template("swift_wrapper.j2")
+        return template.render(**self._swift_template_context())
 
     def to_swift_javascript_wrapper(self) -> str:
         """Convert the JavaScript to a Swift wrapper that executes it via OSAKit"""
         template = jinja_env.get_template("swift_javascript_wrapper.j2")
-
-        command = self.command
-        command_lines = []
-
-        # Process the JavaScript command
-        if self.args:
-            # Replace template variables
-            for line in command.strip().split("\n"):
-                for arg_name in self.args.keys():
-                    # Replace #{arg_name} (without quotes) with Swift string interpolation
-                    line = line.replace(f"#{{{arg_name}}}", f"\\({arg_name})")
-                command_lines.append(line)
-        else:
-            command_lines = command.strip().split("\n")
-
-        # Build param_types and swift_types for template
-        param_types = []
-        swift_types = {}
-        arg_names = []
-
-        if self.args:
-            for arg_name, default_value in self.args.items():
-                arg_names.append(f"{arg_name}: {arg_name}")
-
-                if isinstance(default_value, str):
-                    swift_type = "String"
-                elif isinstance(default_value, bool):
-                    swift_type = "Bool"
-                elif isinstance(default_value, int):
-                    swift_type = "Int"
-                elif isinstance(default_value, float):
-                    swift_type = "Double"
-                else:
-                    swift_type = "String"
-
-                param_types.append(f"{arg_name}: {swift_type}")
-                swift_types[arg_name] = swift_type
-
-        return template.render(
-            name=self.name,
-            command_lines=command_lines,
-            args=self.args or {},
-            param_types=param_types,
-            swift_types=swift_types,
-            arg_names=arg_names,
-        )
+        return template.render(**self._swift_template_context())
 
     def get_filename(self) -> str:
         """Generate a safe filename for the script"""
         # Remove special characters and replace spaces with underscores
-        safe_name = re.sub(r"[^\w\s-]", "", self.name)
-        safe_name = re.sub(r"[-\s]+", "_", safe_name)
+        safe_name = _WS_RE.sub("_", _UNSAFE_CHARS_RE.sub("", self.name)).lower()
         if self.language == "AppleScript":
-            return f"{safe_name.lower()}.scpt"
+            return f"{safe_name}.scpt"
         elif self.language == "JavaScript":
-            return f"{safe_name.lower()}.js"
+            return f"{safe_name}.js"
         else:
             raise ValueError("Not Implemented")
 
@@ -330,53 +434,114 @@ class File(BaseModel):
     tests: list[Script]
 
 
-def validate_yaml_files(yaml_dir: str = "yaml") -> bool:
+# Built once so each YAML file is validated by the compiled pydantic-core schema
+_FILE_ADAPTER = TypeAdapter(File)
+
+
+def load_yaml_file(file_path: str) -> File:
+    """Parse and validate a single YAML test definition file"""
+    data = yaml.load(Path(file_path).read_bytes(), Loader=YamlLoader)
+    return _FILE_ADAPTER.validate_python(data)
+
+
+@functools.lru_cache(maxsize=8)
+def list_yaml_files(yaml_dir: str = "yaml") -> tuple[str, ...]:
+    """List the YAML files under yaml_dir, walking the tree at most once per run"""
+    return tuple(iter_files(yaml_dir, ".yaml"))
+
+
+def _load_yaml_result(file_path: str) -> File | Exception:
+    """Parse a single YAML file, returning the exception instead of raising it"""
+    try:
+        return load_yaml_file(file_path)
+    except Exception as e:
+        return e
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs each call right away in the calling process"""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def _process_pool(
+    item_count: int, min_items: int, jobs: Optional[int] = None
+) -> Executor:
+    """Return a process pool for item_count items, or an inline executor when one wouldn't pay off.
+
+    Every worker process re-imports main.py, which costs far more than parsing
+    or rendering a small tree, so inputs under min_items run inline.
+    """
+    workers = min(jobs or os.cpu_count() or 1, item_count)
+    if workers <= 1 or item_count < min_items:
+        return _InlineExecutor()
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def load_all_yaml(yaml_dir: str = "yaml") -> list[tuple[str, File | Exception]]:
+    """Parse every YAML file once, keeping the exception in place of files that fail"""
+    file_paths = list_yaml_files(yaml_dir)
+    chunksize = max(1, len(file_paths) // (4 * (os.cpu_count() or 1)))
+
+    # Parsing and validation are CPU bound, so spread large trees over several processes
+    with _process_pool(len(file_paths), PARSE_POOL_MIN_FILES) as executor:
+        results = list(executor.map(_load_yaml_result, file_paths, chunksize=chunksize))
+    return list(zip(file_paths, results))
+
+
+def validate_yaml_files(
+    yaml_dir: str = "yaml",
+    files: Optional[list[tuple[str, File | Exception]]] = None,
+    verbose: bool = False,
+) -> bool:
     """Validate all YAML files in the specified directory"""
+    if files is None:
+        files = load_all_yaml(yaml_dir)
     errors = []
+    results = []
     files_validated = 0
     all_script_names = {}  # Dict to track script names and their file locations
 
-    for file in glob.glob(f"{yaml_dir}/**/*.yaml", recursive=True):
-        with open(file, "r") as f:
-            try:
-                script = yaml.safe_load(f)
-                file_obj = File(**script)
-
-                # Check for duplicate script names within this file
-                script_names_in_file = []
-                for test in file_obj.tests:
-                    script_names_in_file.append(test.name)
-
-                # Check for duplicates within the same file
-                if len(script_names_in_file) != len(set(script_names_in_file)):
-                    duplicates = [
-                        name
-                        for name in set(script_names_in_file)
-                        if script_names_in_file.count(name) > 1
-                    ]
-                    for duplicate in duplicates:
-                        error_msg = f"Duplicate script name '{duplicate}' found multiple times in {file}"
-                        errors.append(error_msg)
-                        console.print(f"❌ [red]Error[/red] {error_msg}")
-
-                # Check for duplicates across all files
-                for test in file_obj.tests:
-                    if test.name in all_script_names:
-                        existing_file = all_script_names[test.name]
-                        error_msg = f"Duplicate script name '{test.name}' found in {file} and {existing_file}"
-                        errors.append(error_msg)
-                        console.print(f"❌ [red]Error[/red] {error_msg}")
-                    else:
-                        all_script_names[test.name] = file
+    for file, file_obj in files:
+        try:
+            if isinstance(file_obj, Exception):
+                raise file_obj
+
+            # Check for duplicates within the same file
+            name_counts = Counter(test.name for test in file_obj.tests)
+            for duplicate, count in name_counts.items():
+                if count > 1:
+                    error_msg = f"Duplicate script name '{duplicate}' found multiple times in {file}"
+                    errors.append(error_msg)
+                    console.print(f"❌ [red]Error[/red] {error_msg}")
+
+            # Check for duplicates across all files
+            for test in file_obj.tests:
+                if test.name in all_script_names:
+                    existing_file = all_script_names[test.name]
+                    error_msg = f"Duplicate script name '{test.name}' found in {file} and {existing_file}"
+                    errors.append(error_msg)
+                    console.print(f"❌ [red]Error[/red] {error_msg}")
+                else:
+                    all_script_names[test.name] = file
 
-                files_validated += 1
-                console.print(f"✅ [green]Validated[/green] {file}")
-            except ValidationError as e:
-                errors.append(f"Error validating {file}: {e}")
-                console.print(f"❌ [red]Error[/red] validating {file}: {e}")
-            except Exception as e:
-                errors.append(f"Unexpected error in {file}: {e}")
-                console.print(f"❌ [red]Unexpected error[/red] in {file}: {e}")
+            files_validated += 1
+            results.append(("Validated", file))
+        except ValidationError as e:
+            errors.append(f"Error validating {file}: {e}")
+            console.print(f"❌ [red]Error[/red] validating {file}: {e}")
+        except Exception as e:
+            errors.append(f"Unexpected error in {file}: {e}")
+            console.print(f"❌ [red]Unexpected error[/red] in {file}: {e}")
+
+    if verbose:
+        print_file_results("Validated YAML files", results)
 
     if errors:
         console.print(f"\n[red]Validation failed with {len(errors)} errors[/red]")
@@ -394,47 +559,80 @@ def validate_yaml_files(yaml_dir: str = "yaml") -> bool:
 
 
 def compile_osascript_files(
-    osascript_dir: str = "osascripts", output_dir: str = "releases"
+    osascript_dir: str = "osascripts",
+    output_dir: str = "releases",
+    verbose: bool = False,
+    incremental: bool = False,
 ) -> bool:
     """Compile OSAScript files to .app bundles"""
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    files = []
+    skipped_count = 0
+    for file in iter_files(osascript_dir, ".scpt"):
+        output_file = Path(output_dir) / Path(file).relative_to(osascript_dir)
+        if incremental and is_up_to_date(str(output_file.with_suffix(".app")), file):
+            skipped_count += 1
+            continue
+        files.append(file)
+
+    # Resolve osacompile once rather than failing on every file when it is missing
+    osacompile = shutil.which("osacompile")
+    if files and not osacompile:
+        console.print("[red]❌ osacompile not found in PATH[/red]")
+        return False
 
-    # Create subdirectories for each technique
-    if os.path.exists(osascript_dir):
-        for folder in os.listdir(osascript_dir):
-            folder_path = os.path.join(osascript_dir, folder)
-            if os.path.isdir(folder_path):
-                os.makedirs(os.path.join(output_dir, folder), exist_ok=True)
+    # Create the output subdirectories the files below actually need, once each
+    os.makedirs(output_dir, exist_ok=True)
+    for folder in {
+        os.path.relpath(os.path.dirname(file), osascript_dir) for file in files
+    }:
+        os.makedirs(os.path.join(output_dir, folder), exist_ok=True)
 
     compiled_count = 0
     errors = []
+    results = []
+
+    def compile_one(file: str) -> tuple[str, subprocess.CompletedProcess]:
+        relative_path = Path(file).relative_to(osascript_dir).with_suffix(".app")
+        output_file = str(Path(output_dir) / relative_path)
+        result = subprocess.run(
+            [osacompile, "-x", "-o", output_file, file],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            # osacompile may rewrite an existing bundle without touching the
+            # directory itself, so bump it for the incremental check above
+            os.utime(output_file)
+        return output_file, result
+
+    # Each osacompile is its own process, so run them side by side
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {executor.submit(compile_one, file): file for file in files}
+        for future in as_completed(futures):
+            file = futures[future]
+            try:
+                output_file, result = future.result()
 
-    for file in glob.glob(f"{osascript_dir}/**/*.scpt", recursive=True):
-        try:
-            output_file = file.replace(".scpt", ".app").replace(
-                osascript_dir, output_dir
-            )
-            result = subprocess.run(
-                ["osacompile", "-x", "-o", output_file, file],
-                capture_output=True,
-                text=True,
-            )
+                if result.returncode == 0:
+                    compiled_count += 1
+                    results.append(("Compiled", f"{file} → {output_file}"))
+                else:
+                    error_msg = f"Failed to compile {file}: {result.stderr}"
+                    errors.append(error_msg)
+                    console.print(
+                        f"❌ [red]Failed[/red] to compile {file}: {result.stderr}"
+                    )
 
-            if result.returncode == 0:
-                compiled_count += 1
-                console.print(f"✅ [green]Compiled[/green] {file} → {output_file}")
-            else:
-                error_msg = f"Failed to compile {file}: {result.stderr}"
+            except Exception as e:
+                error_msg = f"Unexpected error compiling {file}: {e}"
                 errors.append(error_msg)
-                console.print(
-                    f"❌ [red]Failed[/red] to compile {file}: {result.stderr}"
-                )
+                console.print(f"❌ [red]Unexpected error[/red] compiling {file}: {e}")
 
-        except Exception as e:
-            error_msg = f"Unexpected error compiling {file}: {e}"
-            errors.append(error_msg)
-            console.print(f"❌ [red]Unexpected error[/red] compiling {file}: {e}")
+    if verbose:
+        print_file_results("Compiled OSAScript files", results)
+
+    if skipped_count:
+        console.print(f"[blue]ℹ️  Skipped {skipped_count} up-to-date apps[/blue]")
 
     if errors:
         console.print(f"\n[red]Compilation completed with {len(errors)} errors[/red]")
@@ -447,48 +645,72 @@ def compile_osascript_files(
     return True
 
 
-def compile_swift_files(swift_dir: str = "swift", output_dir: str = "binaries") -> bool:
+def compile_swift_files(
+    swift_dir: str = "swift",
+    output_dir: str = "binaries",
+    incremental: bool = False,
+) -> bool:
     """Compile Swift files to executables"""
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
 
-    # Create subdirectories for each technique
-    if os.path.exists(swift_dir):
-        for folder in os.listdir(swift_dir):
-            folder_path = os.path.join(swift_dir, folder)
-            if os.path.isdir(folder_path):
-                os.makedirs(os.path.join(output_dir, folder), exist_ok=True)
+    def output_for(file: str) -> str:
+        # Get the base name without extension
+        base_name = os.path.splitext(os.path.basename(file))[0]
+        return os.path.join(
+            os.path.dirname(file).replace(swift_dir, output_dir), base_name
+        )
+
+    files = []
+    skipped_count = 0
+    for file in iter_files(swift_dir, ".swift"):
+        if incremental and is_up_to_date(output_for(file), file):
+            skipped_count += 1
+            continue
+        files.append(file)
+
+    # Create the output subdirectories the files below actually need, once each
+    os.makedirs(output_dir, exist_ok=True)
+    for folder in {
+        os.path.dirname(file).replace(swift_dir, output_dir) for file in files
+    }:
+        os.makedirs(folder, exist_ok=True)
 
     compiled_count = 0
     errors = []
 
-    for file in glob.glob(f"{swift_dir}/**/*.swift", recursive=True):
-        try:
-            # Get the base name without extension
-            base_name = os.path.splitext(os.path.basename(file))[0]
-            output_file = os.path.join(
-                os.path.dirname(file).replace(swift_dir, output_dir), base_name
-            )
+    def compile_one(file: str) -> tuple[str, subprocess.CompletedProcess]:
+        output_file = output_for(file)
 
-            # Compile Swift file to executable
-            result = subprocess.run(
-                ["swiftc", "-o", output_file, file], capture_output=True, text=True
-            )
+        # Compile Swift file to executable
+        result = subprocess.run(
+            ["swiftc", "-o", output_file, file], capture_output=True, text=True
+        )
+        return output_file, result
 
-            if result.returncode == 0:
-                compiled_count += 1
-                console.print(f"✅ [green]Compiled[/green] {file} → {output_file}")
-            else:
-                error_msg = f"Failed to compile {file}: {result.stderr}"
+    # Each swiftc is its own process, so run them side by side
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {executor.submit(compile_one, file): file for file in files}
+        for future in as_completed(futures):
+            file = futures[future]
+            try:
+                output_file, result = future.result()
+
+                if result.returncode == 0:
+                    compiled_count += 1
+                    console.print(f"✅ [green]Compiled[/green] {file} → {output_file}")
+                else:
+                    error_msg = f"Failed to compile {file}: {result.stderr}"
+                    errors.append(error_msg)
+                    console.print(
+                        f"❌ [red]Failed[/red] to compile {file}: {result.stderr}"
+                    )
+
+            except Exception as e:
+                error_msg = f"Unexpected error compiling {file}: {e}"
                 errors.append(error_msg)
-                console.print(
-                    f"❌ [red]Failed[/red] to compile {file}: {result.stderr}"
-                )
+                console.print(f"❌ [red]Unexpected error[/red] compiling {file}: {e}")
 
-        except Exception as e:
-            error_msg = f"Unexpected error compiling {file}: {e}"
-            errors.append(error_msg)
-            console.print(f"❌ [red]Unexpected error[/red] compiling {file}: {e}")
+    if skipped_count:
+        console.print(f"[blue]ℹ️  Skipped {skipped_count} up-to-date executables[/blue]")
 
     if errors:
         console.print(
@@ -505,93 +727,160 @@ def compile_swift_files(swift_dir: str = "swift", output_dir: str = "binaries")
     return True
 
 
+def _write_if_changed(path: str, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that content"""
+    try:
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "w") as f:
+        f.write(content)
+    return True
+
+
+def _convert_file(
+    file_path: str,
+    file_obj: File,
+    output_dir: str,
+    swift_output_dir: str,
+    incremental: bool = False,
+) -> list[tuple[str, bool, bool]]:
+    """Write the script and Swift wrapper for each test of one YAML file.
+
+    Returns (path, written, is_swift) for every output. In incremental mode
+    written is False for outputs that were already newer than the YAML file and
+    its template, or whose regenerated content is unchanged; the latter are not
+    rewritten, only given the mtime of their newest source.
+    """
+    # Create subdirectory based on the YAML file structure
+    yaml_dir_path = os.path.dirname(file_path)
+    technique_id = os.path.basename(yaml_dir_path)
+
+    directory_name = f"{technique_id}"
+
+    script_output_dir = os.path.join(output_dir, directory_name)
+    swift_script_output_dir = os.path.join(swift_output_dir, directory_name)
+
+    created = []
+
+    def emit(path: str, template_name: Optional[str], render, is_swift: bool):
+        sources = (file_path,)
+        if template_name:
+            sources += (os.path.join(template_dir, template_name),)
+        if not incremental:
+            with open(path, "w") as f:
+                f.write(render())
+            written = True
+        elif is_up_to_date(path, *sources):
+            written = False
+        else:
+            written = _write_if_changed(path, render())
+            if not written:
+                # Move the mtime up to the newest source so later runs skip it
+                # without re-rendering, but no further, to avoid needless recompiles
+                newest = max(os.stat(source).st_mtime_ns for source in sources)
+                os.utime(path, ns=(newest, newest))
+        created.append((path, written, is_swift))
+
+    # Convert each test to an OSAScript/JavaScript/Swift file
+    for script in file_obj.tests:
+        filename = script.get_filename()
+        output_path = os.path.join(script_output_dir, filename)
+
+        if script.language == "AppleScript":
+            # Create AppleScript file
+            emit(output_path, "osascript.j2", script.to_osascript, False)
+
+            # Create Swift version that wraps the original AppleScript
+            swift_filename = filename.replace(".scpt", ".swift")
+            emit(
+                os.path.join(swift_script_output_dir, swift_filename),
+                "swift_wrapper.j2",
+                script.to_swift_wrapper,
+                True,
+            )
+
+        elif script.language == "JavaScript":
+            # Create JavaScript file
+            emit(output_path, None, script.to_javascript, False)
+
+            # Create Swift version that wraps the original JavaScript
+            swift_filename = filename.replace(".js", ".swift")
+            emit(
+                os.path.join(swift_script_output_dir, swift_filename),
+                "swift_javascript_wrapper.j2",
+                script.to_swift_javascript_wrapper,
+                True,
+            )
+
+    return created
+
+
 def convert_yaml_to_script(
-    yaml_dir: str = "yaml", output_dir: str = "osascripts"
+    yaml_dir: str = "yaml",
+    output_dir: str = "osascripts",
+    files: Optional[list[tuple[str, File | Exception]]] = None,
+    verbose: bool = False,
+    incremental: bool = False,
 ) -> bool:
     """Convert all YAML test commands to separate OSAScript files"""
+    if files is None:
+        files = load_all_yaml(yaml_dir)
 
-    # Create output directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-
-    # Create Swift output directory
+    # Create the output directories, one subdirectory per technique, up front
     swift_output_dir = output_dir.replace("osascripts", "swift")
-    if not os.path.exists(swift_output_dir):
-        os.makedirs(swift_output_dir)
+    needed_dirs = {output_dir, swift_output_dir}
+    for file_path, file_obj in files:
+        if not isinstance(file_obj, Exception):
+            technique_id = os.path.basename(os.path.dirname(file_path))
+            needed_dirs.add(os.path.join(output_dir, technique_id))
+            needed_dirs.add(os.path.join(swift_output_dir, technique_id))
+    for directory in needed_dirs:
+        os.makedirs(directory, exist_ok=True)
 
     converted_count = 0
     swift_converted_count = 0
+    skipped_count = 0
     errors = []
+    results = []
+
+    # Rendering is pure Python, so spread large trees over several processes
+    with _process_pool(len(files), RENDER_POOL_MIN_FILES) as executor:
+        futures = [
+            (
+                file_path,
+                file_obj,
+                None
+                if isinstance(file_obj, Exception)
+                else executor.submit(
+                    _convert_file,
+                    file_path,
+                    file_obj,
+                    output_dir,
+                    swift_output_dir,
+                    incremental,
+                ),
+            )
+            for file_path, file_obj in files
+        ]
 
-    for file_path in glob.glob(f"{yaml_dir}/**/*.yaml", recursive=True):
+    for file_path, file_obj, future in futures:
         try:
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
-                file_obj = File(**data)
-
-                # Create subdirectory based on the YAML file structure
-                yaml_dir_path = os.path.dirname(file_path)
-                technique_id = os.path.basename(yaml_dir_path)
-
-                directory_name = f"{technique_id}"
-
-                script_output_dir = os.path.join(output_dir, directory_name)
-                swift_script_output_dir = os.path.join(swift_output_dir, directory_name)
-
-                if not os.path.exists(script_output_dir):
-                    os.makedirs(script_output_dir)
-                if not os.path.exists(swift_script_output_dir):
-                    os.makedirs(swift_script_output_dir)
-
-                # Convert each test to an OSAScript/JavaScript/Swift file
-                for script in file_obj.tests:
-                    # Create AppleScript/JavaScript file
-                    if script.language == "AppleScript":
-                        script_content = script.to_osascript()
-                    elif script.language == "JavaScript":
-                        script_content = script.to_javascript()
-
-                    filename = script.get_filename()
-                    output_path = os.path.join(script_output_dir, filename)
-
-                    with open(output_path, "w") as script_file:
-                        script_file.write(script_content)
-
+            if future is None:
+                raise file_obj
+
+            for output_path, written, is_swift in future.result():
+                if not written:
+                    skipped_count += 1
+                    results.append(("Up to date", output_path))
+                elif is_swift:
+                    swift_converted_count += 1
+                    results.append(("Created", output_path))
+                else:
                     converted_count += 1
-                    console.print(f"✅ [green]Created[/green] {output_path}")
-
-                    # Create Swift wrapper for both AppleScript and JavaScript scripts
-                    if script.language == "AppleScript":
-                        swift_filename = script.get_filename().replace(
-                            ".scpt", ".swift"
-                        )
-                        swift_output_path = os.path.join(
-                            swift_script_output_dir, swift_filename
-                        )
-
-                        # Create Swift version that wraps the original AppleScript
-                        swift_wrapper = script.to_swift_wrapper()
-
-                        with open(swift_output_path, "w") as swift_file:
-                            swift_file.write(swift_wrapper)
-
-                        swift_converted_count += 1
-                        console.print(f"✅ [green]Created[/green] {swift_output_path}")
-
-                    elif script.language == "JavaScript":
-                        swift_filename = script.get_filename().replace(".js", ".swift")
-                        swift_output_path = os.path.join(
-                            swift_script_output_dir, swift_filename
-                        )
-
-                        # Create Swift version that wraps the original JavaScript
-                        swift_wrapper = script.to_swift_javascript_wrapper()
-
-                        with open(swift_output_path, "w") as swift_file:
-                            swift_file.write(swift_wrapper)
-
-                        swift_converted_count += 1
-                        console.print(f"✅ [green]Created[/green] {swift_output_path}")
+                    results.append(("Created", output_path))
 
         except ValidationError as e:
             error_msg = f"Validation error in {file_path}: {e}"
@@ -602,6 +891,12 @@ def convert_yaml_to_script(
             errors.append(error_msg)
             console.print(f"❌ [red]Unexpected error[/red] processing {file_path}: {e}")
 
+    if verbose:
+        print_file_results("Converted scripts", results)
+
+    if skipped_count:
+        console.print(f"[blue]ℹ️  Skipped {skipped_count} up-to-date files[/blue]")
+
     if errors:
         console.print(f"\n[red]Conversion completed with {len(errors)} errors[/red]")
         console.print(
@@ -621,19 +916,34 @@ def convert_yaml_to_script(
     return True
 
 
+def _json_bytes(obj, pretty: bool = False) -> bytes:
+    """Serialize obj with orjson when installed, falling back to the json module"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
 def dump_scripts_json(
-    yaml_dir: str = "yaml", output_file: str = "docs/public/api/scripts.json"
+    yaml_dir: str = "yaml",
+    output_file: str = "docs/public/api/scripts.json",
+    files: Optional[list[tuple[str, File | Exception]]] = None,
+    pretty: bool = False,
 ) -> bool:
     """Dump all scripts as JSON array with specified fields"""
+    if files is None:
+        files = load_all_yaml(yaml_dir)
 
-    scripts_data = []
     errors = []
+    script_count = 0
 
-    for file_path in glob.glob(f"{yaml_dir}/**/*.yaml", recursive=True):
-        try:
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
-                file_obj = File(**data)
+    def iter_scripts_data():
+        nonlocal script_count
+        for file_path, file_obj in files:
+            try:
+                if isinstance(file_obj, Exception):
+                    raise file_obj
 
                 # Extract technique info from file path
                 yaml_dir_path = os.path.dirname(file_path)
@@ -653,76 +963,141 @@ def dump_scripts_json(
                         "technique_name": technique_name,
                         "test_number": test_index,
                     }
-                    scripts_data.append(script_data)
+                    script_count += 1
+                    yield script_data
 
-        except ValidationError as e:
-            error_msg = f"Validation error in {file_path}: {e}"
-            errors.append(error_msg)
-            console.print(f"❌ [red]Validation error[/red] in {file_path}: {e}")
-        except Exception as e:
-            error_msg = f"Unexpected error processing {file_path}: {e}"
-            errors.append(error_msg)
-            console.print(f"❌ [red]Unexpected error[/red] processing {file_path}: {e}")
-
-    if errors:
-        console.print(f"\n[red]JSON dump completed with {len(errors)} errors[/red]")
-        console.print(
-            f"[green]Successfully processed: {len(scripts_data)} scripts[/green]"
-        )
+            except ValidationError as e:
+                error_msg = f"Validation error in {file_path}: {e}"
+                errors.append(error_msg)
+                console.print(f"❌ [red]Validation error[/red] in {file_path}: {e}")
+            except Exception as e:
+                error_msg = f"Unexpected error processing {file_path}: {e}"
+                errors.append(error_msg)
+                console.print(
+                    f"❌ [red]Unexpected error[/red] processing {file_path}: {e}"
+                )
 
     # Ensure output directory exists
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write JSON file
+    # Write JSON file one script at a time rather than building the whole array.
+    # The file is consumed by the docs site, so it is compact unless asked otherwise.
     try:
-        with open(output_file, "w") as f:
-            json.dump(scripts_data, f, indent=2, ensure_ascii=False)
-
-        console.print(f"✅ [green]JSON dump created[/green] at {output_file}")
-        console.print(f"[green]Total scripts: {len(scripts_data)}[/green]")
-        return True
+        with open(output_file, "wb") as f:
+            f.write(b"[")
+            for index, script_data in enumerate(iter_scripts_data()):
+                chunk = _json_bytes(script_data, pretty)
+                if pretty:
+                    # Indent the object one level, as it sits inside the array
+                    chunk = b"\n  " + chunk.replace(b"\n", b"\n  ")
+                f.write(chunk if index == 0 else b"," + chunk)
+            f.write(b"\n]" if pretty and script_count else b"]")
 
     except Exception as e:
         console.print(f"❌ [red]Failed to write JSON file[/red]: {e}")
         return False
 
+    if errors:
+        console.print(f"\n[red]JSON dump completed with {len(errors)} errors[/red]")
+        console.print(f"[green]Successfully processed: {script_count} scripts[/green]")
+
+    console.print(f"✅ [green]JSON dump created[/green] at {output_file}")
+    console.print(f"[green]Total scripts: {script_count}[/green]")
+    return True
+
+
+def _write_technique_markdown(
+    output_path: str,
+    technique_id: str,
+    technique_name: str,
+    tests: list[Script],
+    mitre_description: str,
+) -> str:
+    """Render and write the markdown file for one technique, returning its path"""
+    markdown_content = generate_technique_markdown(
+        technique_id, technique_name, tests, mitre_description
+    )
+    with open(output_path, "w") as md_file:
+        md_file.write(markdown_content)
+    return output_path
+
 
 def generate_markdown_docs(
-    yaml_dir: str = "yaml", output_dir: str = "docs/content/docs"
+    yaml_dir: str = "yaml",
+    output_dir: str = "docs/content/docs",
+    files: Optional[list[tuple[str, File | Exception]]] = None,
+    verbose: bool = False,
+    incremental: bool = False,
+    jobs: Optional[int] = None,
 ) -> bool:
     """Generate markdown documentation files from YAML test definitions"""
+    if files is None:
+        files = load_all_yaml(yaml_dir)
 
     # Create output directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
 
     generated_count = 0
+    skipped_count = 0
     errors = []
+    results = []
+    markdown_template = os.path.join(template_dir, "technique_markdown.j2")
+
+    # Look the descriptions up here, so the MITRE data is only loaded in this process
+    tasks = []
+    for file_path, file_obj in files:
+        if isinstance(file_obj, Exception):
+            tasks.append((file_path, file_obj, None))
+            continue
+
+        # Extract technique info from file path
+        yaml_dir_path = os.path.dirname(file_path)
+        technique_id = os.path.basename(yaml_dir_path)
+        technique_name = file_obj.name
+
+        output_path = os.path.join(output_dir, f"{technique_id}.mdx")
+        if incremental and is_up_to_date(output_path, file_path, markdown_template):
+            skipped_count += 1
+            results.append(("Up to date", output_path))
+            continue
+
+        mitre_description = get_technique_description(technique_id)
+        tasks.append(
+            (
+                file_path,
+                file_obj,
+                (
+                    output_path,
+                    technique_id,
+                    technique_name,
+                    file_obj.tests,
+                    mitre_description,
+                ),
+            )
+        )
 
-    for file_path in glob.glob(f"{yaml_dir}/**/*.yaml", recursive=True):
-        try:
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
-                file_obj = File(**data)
-
-                # Extract technique info from file path
-                yaml_dir_path = os.path.dirname(file_path)
-                technique_id = os.path.basename(yaml_dir_path)
-                technique_name = file_obj.name
-
-                # Generate markdown content
-                markdown_content = generate_technique_markdown(
-                    technique_id, technique_name, file_obj.tests
-                )
+    # Rendering is pure Python, so spread large trees over several processes
+    with _process_pool(len(tasks), RENDER_POOL_MIN_FILES, jobs) as executor:
+        futures = [
+            (
+                file_path,
+                file_obj,
+                None
+                if args is None
+                else executor.submit(_write_technique_markdown, *args),
+            )
+            for file_path, file_obj, args in tasks
+        ]
 
-                # Write markdown file
-                output_path = os.path.join(output_dir, f"{technique_id}.mdx")
-                with open(output_path, "w") as md_file:
-                    md_file.write(markdown_content)
+    for file_path, file_obj, future in futures:
+        try:
+            if future is None:
+                raise file_obj
 
-                generated_count += 1
-                console.print(f"✅ [green]Generated[/green] {output_path}")
+            output_path = future.result()
+            generated_count += 1
+            results.append(("Generated", output_path))
 
         except ValidationError as e:
             error_msg = f"Validation error in {file_path}: {e}"
@@ -733,6 +1108,12 @@ def generate_markdown_docs(
             errors.append(error_msg)
             console.print(f"❌ [red]Unexpected error[/red] processing {file_path}: {e}")
 
+    if verbose:
+        print_file_results("Generated markdown files", results)
+
+    if skipped_count:
+        console.print(f"[blue]ℹ️  Skipped {skipped_count} up-to-date files[/blue]")
+
     if errors:
         console.print(
             f"\n[red]Markdown generation completed with {len(errors)} errors[/red]"
@@ -765,11 +1146,15 @@ def format_osascript_command(command: str) -> str:
 
 
 def generate_technique_markdown(
-    technique_id: str, technique_name: str, tests: list[Script]
+    technique_id: str,
+    technique_name: str,
+    tests: list[Script],
+    mitre_description: Optional[str] = None,
 ) -> str:
     """Generate markdown content for a technique"""
     template = jinja_env.get_template("technique_markdown.j2")
-    mitre_description = get_technique_description(technique_id)
+    if mitre_description is None:
+        mitre_description = get_technique_description(technique_id)
 
     # Prepare test data for template
     test_data = []
@@ -777,15 +1162,15 @@ def generate_technique_markdown(
         # Format command for display
         display_command = test.command
         if test.args:
-            for arg_name, default_value in test.args.items():
-                # Replace template variables with example values
-                display_command = display_command.replace(
-                    f"#{{{arg_name}}}", str(default_value)
-                )
+            args = test.args
+            # Replace template variables with example values
+            display_command = _ARG_RE.sub(
+                lambda m: str(args[m.group(1)]) if m.group(1) in args else m.group(0),
+                display_command,
+            )
 
         # Generate safe filename
-        safe_name = re.sub(r"[^\w\s-]", "", test.name)
-        safe_name = re.sub(r"[-\s]+", "_", safe_name).lower()
+        safe_name = _WS_RE.sub("_", _UNSAFE_CHARS_RE.sub("", test.name)).lower()
 
         # Prepare example args for AppleScript with arguments
         example_args = []
@@ -820,11 +1205,100 @@ def generate_technique_markdown(
     )
 
 
+def _prune_dir(root: str, expected: dict[str, set[str]], keep: set[str]) -> list[str]:
+    """Remove root/<technique>/<entry> outputs that are not in expected, returning their paths.
+
+    Technique folders listed in keep (YAML that failed to load) are left alone,
+    as are hidden entries and files directly under root.
+    """
+    removed = []
+    try:
+        techniques = list(os.scandir(root))
+    except FileNotFoundError:
+        return removed
+    for technique in techniques:
+        if technique.name.startswith(".") or technique.name in keep:
+            continue
+        if not technique.is_dir(follow_symlinks=False):
+            continue
+        names = expected.get(technique.name)
+        if names is None:
+            parallel_rmtree(technique.path)
+            removed.append(technique.path)
+            continue
+        with os.scandir(technique.path) as entries:
+            stale = [
+                entry
+                for entry in entries
+                if not entry.name.startswith(".") and entry.name not in names
+            ]
+        for entry in stale:
+            if entry.is_dir(follow_symlinks=False):
+                # .app bundles are directories
+                parallel_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+            removed.append(entry.path)
+    return removed
+
+
+def prune_stale_outputs(
+    files: list[tuple[str, File | Exception]],
+    osascript_dir: str = "osascripts",
+    swift_dir: str = "swift",
+    output_dir: str = "releases",
+    binaries_dir: str = "binaries",
+    docs_dir: str = "docs/content/docs",
+) -> list[str]:
+    """Remove generated outputs whose YAML file or test no longer exists, returning their paths"""
+    scripts, swift, apps, binaries = {}, {}, {}, {}
+    keep = set()
+    for file_path, file_obj in files:
+        technique_id = os.path.basename(os.path.dirname(file_path))
+        if isinstance(file_obj, Exception):
+            keep.add(technique_id)
+            continue
+        for outputs in (scripts, swift, apps, binaries):
+            outputs.setdefault(technique_id, set())
+        for script in file_obj.tests:
+            filename = script.get_filename()
+            stem = os.path.splitext(filename)[0]
+            scripts[technique_id].add(filename)
+            swift[technique_id].add(f"{stem}.swift")
+            binaries[technique_id].add(stem)
+            if script.language == "AppleScript":
+                apps[technique_id].add(f"{stem}.app")
+
+    removed = []
+    removed += _prune_dir(osascript_dir, scripts, keep)
+    removed += _prune_dir(swift_dir, swift, keep)
+    removed += _prune_dir(output_dir, apps, keep)
+    removed += _prune_dir(binaries_dir, binaries, keep)
+
+    # Technique docs sit directly in docs_dir, next to hand-written pages
+    if os.path.exists(docs_dir):
+        for name in os.listdir(docs_dir):
+            technique_id = name.removesuffix(".mdx")
+            if (
+                _TECHNIQUE_DOC_RE.match(name)
+                and technique_id not in scripts
+                and technique_id not in keep
+            ):
+                path = os.path.join(docs_dir, name)
+                os.remove(path)
+                removed.append(path)
+
+    return removed
+
+
 @app.command()
 def validate(
     yaml_dir: Annotated[
         str, typer.Option("--yaml-dir", "-y", help="Directory containing YAML files")
     ] = "yaml",
+    verbose: Annotated[
+        bool, typer.Option("--verbose", "-v", help="List every processed file")
+    ] = False,
 ):
     """Validate YAML test definition files"""
     console.print("[bold blue]🔍 Validating YAML files...[/bold blue]")
@@ -832,7 +1306,7 @@ def validate(
     if not check_directory_exists(yaml_dir, "YAML"):
         raise typer.Exit(1)
 
-    success = validate_yaml_files(yaml_dir)
+    success = validate_yaml_files(yaml_dir, verbose=verbose)
     if not success:
         raise typer.Exit(1)
 
@@ -846,6 +1320,15 @@ def convert(
         str,
         typer.Option("--output-dir", "-o", help="Output directory for OSAScript files"),
     ] = "osascripts",
+    verbose: Annotated[
+        bool, typer.Option("--verbose", "-v", help="List every processed file")
+    ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental", "-i", help="Skip outputs newer than their sources"
+        ),
+    ] = False,
 ):
     """Convert YAML test definitions to OSAScript files"""
     console.print("[bold blue]🔄 Converting YAML to OSAScript files...[/bold blue]")
@@ -853,7 +1336,9 @@ def convert(
     if not check_directory_exists(yaml_dir, "YAML"):
         raise typer.Exit(1)
 
-    success = convert_yaml_to_script(yaml_dir, output_dir)
+    success = convert_yaml_to_script(
+        yaml_dir, output_dir, verbose=verbose, incremental=incremental
+    )
     if not success:
         raise typer.Exit(1)
 
@@ -870,6 +1355,15 @@ def compile(
         str,
         typer.Option("--output-dir", "-o", help="Output directory for compiled apps"),
     ] = "releases",
+    verbose: Annotated[
+        bool, typer.Option("--verbose", "-v", help="List every processed file")
+    ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental", "-i", help="Skip outputs newer than their sources"
+        ),
+    ] = False,
 ):
     """Compile OSAScript files to .app bundles"""
     console.print(
@@ -882,7 +1376,9 @@ def compile(
         )
         raise typer.Exit(1)
 
-    success = compile_osascript_files(osascript_dir, output_dir)
+    success = compile_osascript_files(
+        osascript_dir, output_dir, verbose=verbose, incremental=incremental
+    )
     if not success:
         raise typer.Exit(1)
 
@@ -899,6 +1395,12 @@ def compile_swift(
             "--output-dir", "-o", help="Output directory for compiled executables"
         ),
     ] = "binaries",
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental", "-i", help="Skip outputs newer than their sources"
+        ),
+    ] = False,
 ):
     """Compile Swift files to executables"""
     console.print("[bold blue]🔨 Compiling Swift files to executables...[/bold blue]")
@@ -907,7 +1409,7 @@ def compile_swift(
         os.makedirs(swift_dir)
         console.print(f"[yellow]⚠️ Created Swift directory '{swift_dir}'[/yellow]")
 
-    success = compile_swift_files(swift_dir, output_dir)
+    success = compile_swift_files(swift_dir, output_dir, incremental=incremental)
     if not success:
         raise typer.Exit(1)
 
@@ -924,51 +1426,84 @@ def build(
         str,
         typer.Option("--output-dir", "-o", help="Output directory for compiled apps"),
     ] = "releases",
+    verbose: Annotated[
+        bool, typer.Option("--verbose", "-v", help="List every processed file")
+    ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental", "-i", help="Skip outputs newer than their sources"
+        ),
+    ] = False,
 ):
     """Complete build process: validate, convert, compile, generate docs, and dump JSON"""
     console.print("[bold blue]🚀 Starting complete build process...[/bold blue]")
-    # Clean
-    console.print("\n[bold]Step 0: Cleaning[/bold]")
-    try:
-        clean(
-            osascript_dir=osascript_dir,
-            output_dir=output_dir,
-            binaries_dir="binaries",
-            confirm=True,
-        )
-    except Exception as e:
-        console.print(f"[red]❌ Failed to clean[/red]: {e}")
-        raise typer.Exit(1)
+    swift_dir = osascript_dir.replace("osascripts", "swift")
+
+    # Parse every YAML file once and share the result between the steps below
+    files = load_all_yaml(yaml_dir)
+
+    # Clean, unless up-to-date outputs should be kept; then only remove the
+    # outputs of YAML files and tests that no longer exist
+    if incremental:
+        console.print("\n[bold]Step 0: Pruning stale outputs[/bold]")
+        try:
+            removed = prune_stale_outputs(
+                files, osascript_dir, swift_dir, output_dir, "binaries"
+            )
+        except Exception as e:
+            console.print(f"[red]❌ Failed to prune stale outputs[/red]: {e}")
+            raise typer.Exit(1)
+        if verbose:
+            print_file_results("Pruned outputs", [("Removed", p) for p in removed])
+        console.print(f"[green]✅ Removed {len(removed)} stale outputs[/green]")
+    else:
+        console.print("\n[bold]Step 0: Cleaning[/bold]")
+        try:
+            clean(
+                osascript_dir=osascript_dir,
+                output_dir=output_dir,
+                binaries_dir="binaries",
+                confirm=True,
+            )
+        except Exception as e:
+            console.print(f"[red]❌ Failed to clean[/red]: {e}")
+            raise typer.Exit(1)
 
     # Validate
     console.print("\n[bold]Step 1: Validation[/bold]")
-    if not validate_yaml_files(yaml_dir):
+    if not validate_yaml_files(yaml_dir, files, verbose=verbose):
         raise typer.Exit(1)
 
     # Convert
     console.print("\n[bold]Step 2: Conversion[/bold]")
-    if not convert_yaml_to_script(yaml_dir, osascript_dir):
+    if not convert_yaml_to_script(
+        yaml_dir, osascript_dir, files, verbose=verbose, incremental=incremental
+    ):
         raise typer.Exit(1)
 
     # Compile OSAScript
     console.print("\n[bold]Step 3: OSAScript Compilation[/bold]")
-    if not compile_osascript_files(osascript_dir, output_dir):
+    if not compile_osascript_files(
+        osascript_dir, output_dir, verbose=verbose, incremental=incremental
+    ):
         raise typer.Exit(1)
 
     # Compile Swift
     console.print("\n[bold]Step 4: Swift Compilation[/bold]")
-    swift_dir = osascript_dir.replace("osascripts", "swift")
-    if not compile_swift_files(swift_dir, "binaries"):
+    if not compile_swift_files(swift_dir, "binaries", incremental=incremental):
         raise typer.Exit(1)
 
     # Generate markdown docs
     console.print("\n[bold]Step 5: Documentation Generation[/bold]")
-    if not generate_markdown_docs(yaml_dir):
+    if not generate_markdown_docs(
+        yaml_dir, files=files, verbose=verbose, incremental=incremental
+    ):
         raise typer.Exit(1)
 
     # Dump JSON
     console.print("\n[bold]Step 6: JSON Export[/bold]")
-    if not dump_scripts_json(yaml_dir):
+    if not dump_scripts_json(yaml_dir, files=files):
         raise typer.Exit(1)
 
     # Generate attack navigator layer
@@ -1015,50 +1550,86 @@ def stats(
 ):
     """Show statistics about YAML files, OSAScript files, and compiled apps"""
 
+    def scan_yaml() -> tuple[int, set[str]]:
+        # Count YAML files and techniques (directories in yaml) in the same pass
+        yaml_count = 0
+        techniques = set()
+        for file in list_yaml_files(yaml_dir):
+            yaml_count += 1
+            techniques.add(os.path.basename(os.path.dirname(file)))
+        return yaml_count, techniques
+
+    def scan_osascripts() -> tuple[int, int]:
+        # AppleScript and JavaScript files live side by side, so count both in one walk
+        osascript_count = js_count = 0
+        for file in iter_files(osascript_dir, (".scpt", ".js")):
+            if file.endswith(".scpt"):
+                osascript_count += 1
+            else:
+                js_count += 1
+        return osascript_count, js_count
+
+    def scan_binaries() -> int:
+        # Count compiled executables (requires special handling)
+        exe_count = 0
+        if os.path.exists(binaries_dir):
+            for root, dirs, files in os.walk(binaries_dir):
+                for file in files:
+                    if not file.endswith(".app") and os.access(
+                        os.path.join(root, file), os.X_OK
+                    ):
+                        exe_count += 1
+        return exe_count
+
+    # The scans are independent and mostly wait on the filesystem, so overlap them
+    with ThreadPoolExecutor() as executor:
+        yaml_future = executor.submit(scan_yaml)
+        osascript_future = executor.submit(scan_osascripts)
+        swift_future = executor.submit(count_files, swift_dir, ".swift")
+        app_future = executor.submit(count_files, output_dir, ".app")
+        exe_future = executor.submit(scan_binaries)
+
+    yaml_count, techniques = yaml_future.result()
+    techniques = sorted(techniques)
+    osascript_count, js_count = osascript_future.result()
+    swift_count = swift_future.result()
+    app_count = app_future.result()
+    exe_count = exe_future.result()
+
+    rows = [
+        ("YAML Files", str(yaml_count), f"Across {len(techniques)} techniques"),
+        ("AppleScript Files", str(osascript_count), "Generated from YAML"),
+        ("JavaScript Files", str(js_count), "Generated from YAML"),
+        ("Swift Wrappers", str(swift_count), "For AppleScript commands"),
+        ("Compiled Apps", str(app_count), "Ready to execute"),
+        ("Executables", str(exe_count), "Compiled executables"),
+    ]
+
+    # Piped output (CI logs, grep) gets plain tab-separated lines instead of a table
+    if not console.is_terminal:
+        lines = ["\t".join(row) for row in rows]
+        if yaml_count > 0:
+            lines.append("\nTechniques found:")
+            lines.extend(f"  • {technique}" for technique in techniques)
+        print("\n".join(lines))
+        return
+
+    from rich.table import Table
+
     table = Table(title="LOAS Project Statistics")
     table.add_column("Category", style="cyan", no_wrap=True)
     table.add_column("Count", style="magenta")
     table.add_column("Details", style="green")
-
-    # Count YAML files
-    yaml_files = glob.glob(f"{yaml_dir}/**/*.yaml", recursive=True)
-    yaml_count = len(yaml_files)
-
-    # Count techniques (directories in yaml)
-    techniques = set()
-    for file in yaml_files:
-        technique = os.path.basename(os.path.dirname(file))
-        techniques.add(technique)
-
-    # Count files using helper function
-    osascript_count = count_files(osascript_dir, "*.scpt")
-    js_count = count_files(osascript_dir, "*.js")
-    swift_count = count_files(swift_dir, "*.swift")
-    app_count = count_files(output_dir, "*.app")
-
-    # Count compiled executables (requires special handling)
-    exe_count = 0
-    if os.path.exists(binaries_dir):
-        for root, dirs, files in os.walk(binaries_dir):
-            for file in files:
-                if not file.endswith(".app") and os.access(
-                    os.path.join(root, file), os.X_OK
-                ):
-                    exe_count += 1
-
-    table.add_row("YAML Files", str(yaml_count), f"Across {len(techniques)} techniques")
-    table.add_row("AppleScript Files", str(osascript_count), "Generated from YAML")
-    table.add_row("JavaScript Files", str(js_count), "Generated from YAML")
-    table.add_row("Swift Wrappers", str(swift_count), "For AppleScript commands")
-    table.add_row("Compiled Apps", str(app_count), "Ready to execute")
-    table.add_row("Executables", str(exe_count), "Compiled executables")
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
     if yaml_count > 0:
-        console.print("\n[bold]Techniques found:[/bold]")
-        for technique in sorted(techniques):
-            console.print(f"  • {technique}")
+        console.print(
+            "\n[bold]Techniques found:[/bold]\n"
+            + "\n".join(f"  • {technique}" for technique in techniques)
+        )
 
 
 @app.command()
@@ -1114,9 +1685,7 @@ def clean(
     if os.path.exists(docs_dir):
         # Find files matching T1000 or T1000.001 pattern
         for file in os.listdir(docs_dir):
-            if re.match(r"T\d{4}\.mdx$", file) or re.match(
-                r"T\d{4}\.\d{3}\.mdx$", file
-            ):
+            if _TECHNIQUE_DOC_RE.match(file):
                 docs_files_to_clean.append(os.path.join(docs_dir, file))
 
     if not dirs_to_clean and not files_to_clean and not docs_files_to_clean:
@@ -1125,38 +1694,34 @@ def clean(
 
     if not confirm:
         console.print(
-            "[yellow]This will delete the following directories and files:[/yellow]"
+            "[yellow]This will delete the following directories and files:[/yellow]\n"
+            + "\n".join(
+                f"  • {path}"
+                for path in dirs_to_clean + files_to_clean + docs_files_to_clean
+            )
         )
-        for dir_path in dirs_to_clean:
-            console.print(f"  • {dir_path}")
-        for file_path in files_to_clean:
-            console.print(f"  • {file_path}")
-        for file_path in docs_files_to_clean:
-            console.print(f"  • {file_path}")
         if not typer.confirm("Are you sure you want to continue?"):
             console.print("[yellow]Operation cancelled[/yellow]")
             return
 
+    # Report everything in one print once the removals are done
+    results = []
+
     for dir_path in dirs_to_clean:
         try:
-            shutil.rmtree(dir_path)
-            console.print(f"✅ [green]Cleaned[/green] {dir_path}")
+            parallel_rmtree(dir_path)
+            results.append(f"✅ [green]Cleaned[/green] {dir_path}")
         except Exception as e:
-            console.print(f"❌ [red]Failed to clean[/red] {dir_path}: {e}")
+            results.append(f"❌ [red]Failed to clean[/red] {dir_path}: {e}")
 
-    for file_path in files_to_clean:
+    for file_path in files_to_clean + docs_files_to_clean:
         try:
             os.remove(file_path)
-            console.print(f"✅ [green]Cleaned[/green] {file_path}")
+            results.append(f"✅ [green]Cleaned[/green] {file_path}")
         except Exception as e:
-            console.print(f"❌ [red]Failed to clean[/red] {file_path}: {e}")
+            results.append(f"❌ [red]Failed to clean[/red] {file_path}: {e}")
 
-    for file_path in docs_files_to_clean:
-        try:
-            os.remove(file_path)
-            console.print(f"✅ [green]Cleaned[/green] {file_path}")
-        except Exception as e:
-            console.print(f"❌ [red]Failed to clean[/red] {file_path}: {e}")
+    console.print("\n".join(results))
 
 
 @app.command()
@@ -1167,6 +1732,9 @@ def dump_json(
     output_file: Annotated[
         str, typer.Option("--output-file", "-o", help="Output JSON file path")
     ] = "docs/public/api/scripts.json",
+    pretty: Annotated[
+        bool, typer.Option("--pretty", help="Indent the JSON for readability")
+    ] = False,
 ):
     """Dump all scripts as JSON array for web consumption"""
     console.print("[bold blue]📄 Dumping scripts to JSON...[/bold blue]")
@@ -1174,7 +1742,7 @@ def dump_json(
     if not check_directory_exists(yaml_dir, "YAML"):
         raise typer.Exit(1)
 
-    success = dump_scripts_json(yaml_dir, output_file)
+    success = dump_scripts_json(yaml_dir, output_file, pretty=pretty)
     if not success:
         raise typer.Exit(1)
 
@@ -1188,6 +1756,24 @@ def generate_docs(
         str,
         typer.Option("--output-dir", "-o", help="Output directory for markdown files"),
     ] = "docs/content/docs",
+    verbose: Annotated[
+        bool, typer.Option("--verbose", "-v", help="List every processed file")
+    ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental", "-i", help="Skip outputs newer than their sources"
+        ),
+    ] = False,
+    jobs: Annotated[
+        Optional[int],
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Number of worker processes (default: CPU count; 1 renders inline)",
+        ),
+    ] = None,
 ):
     """Generate markdown documentation files from YAML test definitions"""
     console.print("[bold blue]📝 Generating markdown documentation...[/bold blue]")
@@ -1195,7 +1781,9 @@ def generate_docs(
     if not check_directory_exists(yaml_dir, "YAML"):
         raise typer.Exit(1)
 
-    success = generate_markdown_docs(yaml_dir, output_dir)
+    success = generate_markdown_docs(
+        yaml_dir, output_dir, verbose=verbose, incremental=incremental, jobs=jobs
+    )
     if not success:
         raise typer.Exit(1)
 
@@ -1294,8 +1882,6 @@ def generate_attack_navigator_layer(
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
     # Save to file with proper JSON formatting
-    import json
-
     with open(output_file, "w", encoding="utf-8") as f:
         json.dump(layer_data, f, indent=2, ensure_ascii=False)
 
@@ -1347,6 +1933,8 @@ def generate_atomics(
         shutil.rmtree(output_dir)
     os.makedirs(output_dir)
 
+    import requests
+
     # Download models.py from Atomic Red Team repository
     console.print("[blue]Downloading models.py from Atomic Red Team...[/blue]")
     models_url = "https://raw.githubusercontent.com/redcanaryco/atomic-red-team/master/atomic_red_team/models.py"
@@ -1366,8 +1954,6 @@ def generate_atomics(
 
     # Import the models dynamically
     try:
-        import importlib.util
-
         spec = importlib.util.spec_from_file_location("atomic_models", models_path)
         atomic_models = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(atomic_models)
@@ -1380,11 +1966,10 @@ def generate_atomics(
     errors = []
 
     # Process each YAML file
-    for file_path in glob.glob(f"{yaml_dir}/**/*.yaml", recursive=True):
+    for file_path in list_yaml_files(yaml_dir):
         try:
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
-                file_obj = File(**data)
+            data = yaml.load(Path(file_path).read_bytes(), Loader=YamlLoader)
+            file_obj = _FILE_ADAPTER.validate_python(data)
 
             # Extract technique info
             yaml_dir_path = os.path.dirname(file_path)
@@ -1494,8 +2079,7 @@ def generate_atomics(
 
             # Create technique directory in output
             technique_output_dir = os.path.join(output_dir, technique_id)
-            if not os.path.exists(technique_output_dir):
-                os.makedirs(technique_output_dir)
+            os.makedirs(technique_output_dir, exist_ok=True)
 
             # Write Atomic YAML file
             output_path = os.path.join(technique_output_dir, f"{technique_id}.yaml")
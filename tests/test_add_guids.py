@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import add_guids
+
+GUID_A = "019a8de9-49b2-7670-9f84-b53bc00bddf1"
+GUID_B = "019a8de9-49b2-7670-9f84-b53bc00bddf2"
+
+CRLF_YAML = (
+    "name: Data from Local System\r\n"
+    "tests:\r\n"
+    "  - name: First test\r\n"
+    f"    guid: {GUID_A}\r\n"
+    "    description: Has a GUID\r\n"
+    "  - name: Second test\r\n"
+    "    description: Needs a GUID\r\n"
+)
+
+
+class GuidTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write(self, relative: str, content: str) -> str:
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content.encode())
+        return str(path)
+
+
+class CrlfTests(GuidTestCase):
+    def test_existing_guids_are_collected(self):
+        path = self.write("T1005/T1005.yaml", CRLF_YAML)
+        self.assertEqual(add_guids._collect_guids(path), {GUID_A})
+
+    def test_inserted_guid_keeps_crlf_line_endings(self):
+        path = self.write("T1005/T1005.yaml", CRLF_YAML)
+        existing = set()
+
+        updated = add_guids.generate_guids_for_yaml(path, lambda: GUID_B, existing)
+
+        self.assertTrue(updated)
+        data = Path(path).read_bytes()
+        self.assertEqual(data.count(b"\n"), data.count(b"\r\n"))
+        self.assertIn(f"  - name: Second test\r\n    guid: {GUID_B}\r\n".encode(), data)
+        self.assertEqual(existing, {GUID_A, GUID_B})
+
+    def test_filled_in_guid_keeps_crlf_line_endings(self):
+        path = self.write(
+            "T1005/T1005.yaml",
+            "tests:\r\n  - name: Only test\r\n    guid:\r\n    description: x\r\n",
+        )
+
+        add_guids.generate_guids_for_yaml(path, lambda: GUID_B, set())
+
+        self.assertEqual(
+            Path(path).read_bytes(),
+            f"tests:\r\n  - name: Only test\r\n    guid: {GUID_B}\r\n"
+            "    description: x\r\n".encode(),
+        )
+
+    def test_complete_file_is_left_untouched(self):
+        content = CRLF_YAML.replace(
+            "  - name: Second test\r\n",
+            f"  - name: Second test\r\n    guid: {GUID_B}\r\n",
+        )
+        path = self.write("T1005/T1005.yaml", content)
+
+        self.assertFalse(add_guids.generate_guids_for_yaml(path, None, set()))
+        self.assertEqual(Path(path).read_bytes(), content.encode())
+
+    def test_duplicates_are_reported(self):
+        first = self.write("T1005/T1005.yaml", CRLF_YAML)
+        second = self.write("T1006/T1006.yaml", CRLF_YAML)
+
+        has_duplicates, duplicates = add_guids.check_for_duplicate_guids(str(self.root))
+
+        self.assertTrue(has_duplicates)
+        self.assertEqual(sorted(duplicates[GUID_A]), sorted([(first, 4), (second, 4)]))
+
+
+class KeyMatchingTests(GuidTestCase):
+    def test_uppercase_keys_are_collected(self):
+        path = self.write(
+            "T1005/T1005.yaml",
+            f"tests:\n  - Name: Only test\n    GUID: {GUID_A}\n",
+        )
+        existing = set()
+
+        self.assertFalse(add_guids.generate_guids_for_yaml(path, None, existing))
+        self.assertEqual(existing, {GUID_A})
+
+    def test_extra_space_after_dash_still_gets_a_guid(self):
+        path = self.write(
+            "T1005/T1005.yaml",
+            f"tests:\n  - name: First test\n    guid: {GUID_A}\n"
+            "  -   name: Second test\n",
+        )
+
+        updated = add_guids.generate_guids_for_yaml(path, lambda: GUID_B, set())
+
+        self.assertTrue(updated)
+        self.assertTrue(
+            Path(path).read_text().endswith(f"Second test\n      guid: {GUID_B}\n")
+        )
+
+    def test_guid_after_description_still_gets_a_guid(self):
+        path = self.write(
+            "T1005/T1005.yaml",
+            f"tests:\n  - name: Only test\n    description: x\n    guid: {GUID_A}\n",
+        )
+
+        updated = add_guids.generate_guids_for_yaml(path, lambda: GUID_B, set())
+
+        self.assertTrue(updated)
+        self.assertTrue(
+            Path(path)
+            .read_text()
+            .startswith(f"tests:\n  - name: Only test\n    guid: {GUID_B}\n")
+        )
+
+
+class AddGuidsToYamlFilesTests(GuidTestCase):
+    def test_small_tree_is_processed_inline(self):
+        self.write("T1005/T1005.yaml", CRLF_YAML)
+        self.write("T1006/T1006.yaml", "tests:\n  - name: Only test\n")
+
+        self.assertIsInstance(
+            add_guids._process_pool(2, add_guids._POOL_MIN_FILES),
+            add_guids._InlineExecutor,
+        )
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        try:
+            total, updated = add_guids.add_guids_to_yaml_files(str(self.root))
+        finally:
+            os.chdir(cwd)
+
+        self.assertEqual((total, updated), (2, 2))
+        self.assertFalse(add_guids.check_for_duplicate_guids(str(self.root))[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
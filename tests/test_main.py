@@ -0,0 +1,175 @@
+import glob
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import main
+
+
+class ParallelRmtreeTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_removes_nested_tree(self):
+        releases = self.root / "releases"
+        (releases / "T1005" / "a.app" / "Contents").mkdir(parents=True)
+        (releases / "T1005" / "a.app" / "Contents" / "Info.plist").write_text("x")
+        (releases / "top.txt").write_text("x")
+
+        main.parallel_rmtree(str(releases))
+
+        self.assertFalse(releases.exists())
+
+    def test_refuses_symlinked_root(self):
+        target = self.root / "target"
+        (target / "T1005").mkdir(parents=True)
+        (target / "T1005" / "keep.app").write_text("x")
+        releases = self.root / "releases"
+        os.symlink(target, releases)
+
+        with self.assertRaises(OSError):
+            main.parallel_rmtree(str(releases))
+
+        self.assertTrue((target / "T1005" / "keep.app").exists())
+        self.assertTrue(releases.is_symlink())
+
+    def test_symlink_inside_tree_is_unlinked_not_followed(self):
+        target = self.root / "target"
+        target.mkdir()
+        (target / "keep.txt").write_text("x")
+        releases = self.root / "releases"
+        releases.mkdir()
+        os.symlink(target, releases / "link")
+
+        main.parallel_rmtree(str(releases))
+
+        self.assertFalse(releases.exists())
+        self.assertTrue((target / "keep.txt").exists())
+
+
+class ListYamlFilesTests(unittest.TestCase):
+    def test_walks_like_glob_and_skips_hidden_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for relative in (
+                "T1005/T1005.yaml",
+                "T1010/T1010.yaml",
+                "T1010/nested/extra.yaml",
+                "T1010/.hidden.yaml",
+                ".git/ignored.yaml",
+            ):
+                path = Path(tmp, relative)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("name: x\n")
+
+            files = main.list_yaml_files(tmp)
+
+            self.assertEqual(
+                list(files),
+                glob.glob(os.path.join(tmp, "**", "*.yaml"), recursive=True),
+            )
+        self.assertEqual(len(files), 3)
+
+
+class IncrementalConvertTests(unittest.TestCase):
+    def test_unchanged_output_is_not_rendered_again(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(main.__file__).parent / "yaml" / "T1005" / "T1005.yaml"
+            yaml_file = Path(tmp, "yaml", "T1005", "T1005.yaml")
+            yaml_file.parent.mkdir(parents=True)
+            yaml_file.write_bytes(source.read_bytes())
+            file_obj = main.load_yaml_file(str(yaml_file))
+            output_dir = Path(tmp, "osascripts")
+            swift_dir = Path(tmp, "swift")
+            (output_dir / "T1005").mkdir(parents=True)
+            (swift_dir / "T1005").mkdir(parents=True)
+
+            def convert():
+                return main._convert_file(
+                    str(yaml_file), file_obj, str(output_dir), str(swift_dir), True
+                )
+
+            convert()
+            # Touch the YAML file without changing what it renders to
+            later = os.stat(yaml_file).st_mtime_ns + 10**9
+            os.utime(yaml_file, ns=(later, later))
+
+            self.assertTrue(all(not written for _, written, _ in convert()))
+            for path, _, _ in convert():
+                self.assertTrue(main.is_up_to_date(path, str(yaml_file)))
+                self.assertEqual(os.stat(path).st_mtime_ns, later)
+
+
+class PruneStaleOutputsTests(unittest.TestCase):
+    def test_removes_outputs_without_a_source(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            source = Path(main.__file__).parent / "yaml" / "T1005" / "T1005.yaml"
+            yaml_file = root / "yaml" / "T1005" / "T1005.yaml"
+            yaml_file.parent.mkdir(parents=True)
+            yaml_file.write_bytes(source.read_bytes())
+            files = [(str(yaml_file), main.load_yaml_file(str(yaml_file)))]
+            current = files[0][1].tests[0].get_filename().removesuffix(".scpt")
+
+            dirs = {
+                name: root / name
+                for name in ("osascripts", "swift", "releases", "binaries", "docs")
+            }
+            expected = [
+                dirs["osascripts"] / "T1005" / f"{current}.scpt",
+                dirs["swift"] / "T1005" / f"{current}.swift",
+                dirs["releases"] / "T1005" / f"{current}.app" / "Contents",
+                dirs["binaries"] / "T1005" / current,
+                dirs["docs"] / "T1005.mdx",
+                dirs["docs"] / "index.mdx",
+            ]
+            stale = [
+                dirs["osascripts"] / "T1005" / "renamed_test.scpt",
+                dirs["swift"] / "T1005" / "renamed_test.swift",
+                dirs["releases"] / "T1005" / "renamed_test.app" / "Contents",
+                dirs["binaries"] / "T1005" / "renamed_test",
+                dirs["osascripts"] / "T9999" / "deleted.scpt",
+                dirs["docs"] / "T9999.mdx",
+            ]
+            for path in expected + stale:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("x")
+
+            removed = main.prune_stale_outputs(
+                files,
+                str(dirs["osascripts"]),
+                str(dirs["swift"]),
+                str(dirs["releases"]),
+                str(dirs["binaries"]),
+                str(dirs["docs"]),
+            )
+
+            self.assertTrue(all(path.exists() for path in expected))
+            self.assertFalse(any(path.exists() for path in stale))
+            self.assertFalse((dirs["osascripts"] / "T9999").exists())
+            self.assertEqual(len(removed), 6)
+
+    def test_keeps_outputs_of_yaml_that_failed_to_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp, "osascripts", "T1005", "kept.scpt")
+            script.parent.mkdir(parents=True)
+            script.write_text("x")
+
+            main.prune_stale_outputs(
+                [("yaml/T1005/T1005.yaml", ValueError("bad yaml"))],
+                str(Path(tmp, "osascripts")),
+                str(Path(tmp, "swift")),
+                str(Path(tmp, "releases")),
+                str(Path(tmp, "binaries")),
+                str(Path(tmp, "docs")),
+            )
+
+            self.assertTrue(script.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()